@@ -14,13 +14,41 @@ since the code is already in the mirror via branch sync.
 """
 
 import argparse
+import asyncio
+import contextlib
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
 import time
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from collections import Counter
+from dataclasses import astuple, dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+# PR sync is dominated by network round trips, so PRs are processed
+# concurrently on one event loop, with fewer gh processes in flight than PRs
+PR_CONCURRENCY = 16
+GH_CONCURRENCY = 8
+
+# Retries of a gh call rejected by a secondary rate limit
+GH_RATE_LIMIT_RETRIES = 3
+
+# Refspecs per git fetch/push, keeping argv well under system limits
+GIT_BATCH_SIZE = 100
+
+# createPullRequest mutations per GraphQL request
+CREATE_BATCH_SIZE = 20
+
+# Fingerprint of the PR listings from the last sync that had nothing to do,
+# and the upstream updatedAt each mirror PR was last synced at, relative to
+# the mirror checkout
+SYNC_STATE_FILE = os.path.join(".state", "last_sync.json")
+
+_MENTION_RE = re.compile(r'@(\w+)')
 
 
 @dataclass
@@ -31,90 +59,452 @@ class RepoConfig:
     excluded_prs: Set[int] = field(default_factory=set)
 
 
-def run_cmd(cmd: List[str], capture: bool = True, check: bool = True) -> Optional[str]:
-    """Run a command and return stdout."""
+@dataclass(slots=True)
+class ForkPR:
+    """An open PR on the fork. Fields are in the order get_fork_prs lists them."""
+    number: int
+    title: str
+    head_ref: str
+    head_sha: str
+    labels: List[str]
+    is_draft: bool
+    node_id: str
+    body: Optional[str] = None  # Not listed; filled in by load_pr_bodies
+
+
+async def _exec_cmd(cmd: List[str], capture: bool = True, input: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run a command, optionally feeding input to stdin, and return how it went."""
+    pipe = asyncio.subprocess.PIPE if capture else None
+    stdin = asyncio.subprocess.PIPE if input is not None else None
+    proc = await asyncio.create_subprocess_exec(*cmd, stdin=stdin, stdout=pipe, stderr=pipe)
+    stdout, stderr = await proc.communicate(input.encode() if input is not None else None)
+    stdout = stdout.decode() if stdout is not None else None
+    stderr = stderr.decode() if stderr is not None else None
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def _cmd_output(result: subprocess.CompletedProcess, capture: bool = True, check: bool = True) -> Optional[str]:
+    """Return a finished command's stdout, raising if it failed and check is set."""
+    if check and result.returncode != 0:
+        print(f"Command failed: {' '.join(result.args)}")
+        if result.stderr:
+            print(f"Error: {result.stderr}")
+        raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+    return result.stdout.strip() if capture else None
+
+
+async def run_cmd(cmd: List[str], capture: bool = True, check: bool = True, input: Optional[str] = None) -> Optional[str]:
+    """Run a command and return stdout, optionally feeding input to stdin."""
+    return _cmd_output(await _exec_cmd(cmd, capture, input), capture, check)
+
+
+class GHRateLimiter:
+    """
+    Paces gh calls against GitHub's GraphQL rate limit, which backs the gh
+    pr commands.
+
+    The remaining quota is seeded from `gh api rate_limit`, debited locally
+    per call and re-synced every RESYNC_INTERVAL calls. Calls are only
+    delayed once the quota left drops below MIN_CALLS_PER_SECOND for the
+    rest of the window.
+
+    That quota doesn't cover GitHub's secondary limits on writes, so calls
+    that create or change content also run one at a time, MUTATION_INTERVAL
+    apart per write, and all calls pause after a secondary limit is hit.
+    """
+
+    RESYNC_INTERVAL = 50
+    MIN_CALLS_PER_SECOND = 0.1
+    MUTATION_INTERVAL = 1.0  # seconds
+    BACKOFF_SECONDS = 60
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.calls_since_sync: Optional[int] = None
+        self.paused_until = 0.0
+        self.mutation_lock = asyncio.Lock()
+        self.next_mutation_at = 0.0
+
+    async def _sync(self) -> None:
+        """Refresh remaining quota and reset time from GitHub."""
+        self.calls_since_sync = 0
+        # Querying the rate limit doesn't count against it
+        result = await run_cmd(["gh", "api", "rate_limit"], check=False)
+        try:
+            limits = json.loads(result)["resources"]["graphql"]
+            self.remaining = limits["remaining"]
+            self.reset_at = limits["reset"]
+        except (TypeError, ValueError, KeyError):
+            # Unknown quota; don't pace until the next sync succeeds
+            self.remaining = None
+
+    async def acquire(self) -> None:
+        """Account for one gh call, sleeping first if the quota is running low."""
+        async with self.lock:
+            pause = self.paused_until - time.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            if self.calls_since_sync is None or self.calls_since_sync >= self.RESYNC_INTERVAL:
+                await self._sync()
+            self.calls_since_sync += 1
+            if self.remaining is None:
+                return
+
+            window = max(self.reset_at - time.time(), 1.0)
+            if self.remaining <= 0:
+                delay = window
+            elif self.remaining / window < self.MIN_CALLS_PER_SECOND:
+                # Spread what's left evenly over the rest of the window
+                delay = window / self.remaining
+            else:
+                delay = 0
+
+            if delay:
+                print(f"Rate limit low ({self.remaining} left), waiting {delay:.1f}s")
+                # Sleep while holding the lock so all callers are paced together
+                await asyncio.sleep(delay)
+                if self.remaining <= 0:
+                    await self._sync()
+            if self.remaining is not None:
+                self.remaining -= 1
+
+    @contextlib.asynccontextmanager
+    async def mutation(self, count: int) -> AsyncIterator[None]:
+        """Hold the write slot for a call making count writes, spaced from the last one."""
+        async with self.mutation_lock:
+            delay = self.next_mutation_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                yield
+            finally:
+                self.next_mutation_at = time.monotonic() + self.MUTATION_INTERVAL * count
+
+    def back_off(self, attempt: int) -> float:
+        """Pause all gh calls after a secondary rate limit. Returns the pause in seconds."""
+        # gh doesn't expose the retry-after header, so follow GitHub's advice
+        # to wait at least a minute, longer on each retry
+        delay = self.BACKOFF_SECONDS * 2 ** attempt
+        self.paused_until = max(self.paused_until, time.time() + delay)
+        return delay
+
+
+GH_RATE_LIMITER = GHRateLimiter()
+GH_SLOTS = asyncio.Semaphore(GH_CONCURRENCY)
+
+
+def _secondary_rate_limited(result: subprocess.CompletedProcess) -> bool:
+    """Check whether a failed gh call was rejected by a secondary rate limit."""
+    output = f"{result.stdout or ''}{result.stderr or ''}".lower()
+    return "secondary rate limit" in output or "abuse detection" in output
+
+
+async def run_gh(args: List[str], check: bool = True, input: Optional[str] = None, mutations: int = 0) -> Optional[str]:
+    """
+    Run a gh CLI command. mutations is how many writes the call makes, so
+    they can be paced; calls hitting a secondary rate limit are retried.
+    """
+    cmd = ["gh"] + args
+    for attempt in range(GH_RATE_LIMIT_RETRIES + 1):
+        await GH_RATE_LIMITER.acquire()
+        async with GH_RATE_LIMITER.mutation(mutations) if mutations else contextlib.nullcontext():
+            async with GH_SLOTS:
+                result = await _exec_cmd(cmd, input=input)
+        if result.returncode == 0 or attempt == GH_RATE_LIMIT_RETRIES or not _secondary_rate_limited(result):
+            break
+        delay = GH_RATE_LIMITER.back_off(attempt)
+        print(f"Secondary rate limit hit, pausing gh calls for {delay:.0f}s")
+    return _cmd_output(result, check=check)
+
+
+async def run_graphql(query: str, variables: Dict, mutations: int = 0) -> Dict:
+    """
+    Run a GraphQL request and return its data. Fields that errored are
+    null; their errors are printed. mutations is how many writes the
+    request makes, as for run_gh.
+    """
+    # Send the request on stdin so large variables (PR bodies) stay out of argv.
+    # Partial errors make gh exit non-zero but it still prints the response.
+    result = await run_gh(
+        ["api", "graphql", "--input", "-"],
+        check=False,
+        input=json.dumps({"query": query, "variables": variables}),
+        mutations=mutations
+    )
+    if not result:
+        return {}
+
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=capture,
-            text=True,
-            check=check
-        )
-        return result.stdout.strip() if capture else None
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed: {' '.join(cmd)}")
-        if e.stderr:
-            print(f"Error: {e.stderr}")
-        if check:
-            raise
-        return None
+        response = json.loads(result)
+    except ValueError:
+        # e.g. an HTML error page from a proxy; treat every field as failed
+        print(f"  GraphQL request failed: {result[:200]}")
+        return {}
+    for error in response.get("errors") or []:
+        print(f"  GraphQL error: {error.get('message')}")
+    return response.get("data") or {}
+
 
+async def run_git(args: List[str], check: bool = True) -> Optional[str]:
+    """Run a git command."""
+    return await run_cmd(["git"] + args, check=check)
 
-def run_gh(args: List[str], check: bool = True) -> Optional[str]:
-    """Run a gh CLI command."""
-    return run_cmd(["gh"] + args, check=check)
+
+async def run_git_batched(args: List[str], transfers: List[Tuple[str, str]], refspec: Callable[[str, str], str]) -> List[Tuple[str, str]]:
+    """
+    Run a git command with one refspec per (upstream_ref, branch_name),
+    batching many refspecs into each invocation.
+    Returns the transfers the command succeeded for.
+    """
+    done = []
+    for i in range(0, len(transfers), GIT_BATCH_SIZE):
+        chunk = transfers[i:i + GIT_BATCH_SIZE]
+        try:
+            await run_git(args + [refspec(*transfer) for transfer in chunk])
+            done.extend(chunk)
+            continue
+        except subprocess.CalledProcessError:
+            if len(chunk) == 1:
+                print(f"  Failed to sync branch: {chunk[0][1]}")
+                continue
+
+        # A single bad ref fails the whole batch, so retry one at a time
+        for transfer in chunk:
+            try:
+                await run_git(args + [refspec(*transfer)])
+                done.append(transfer)
+            except subprocess.CalledProcessError:
+                print(f"  Failed to sync branch: {transfer[1]}")
+    return done
+
+
+def write_file_atomic(path: str, content: str) -> None:
+    """Write a file via a temp file and rename so readers never see partial output."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+async def list_open_prs(repo: str, limit: int, fields: str, jq: str) -> List[str]:
+    """
+    List up to limit of the newest open PRs of a repo via GraphQL.
+    Returns one line per PR, as projected by the jq filter.
+    """
+    owner, name = repo.split("/", 1)
+    query = (
+        "query($owner: String!, $name: String!, $first: Int!, $after: String) {"
+        " repository(owner: $owner, name: $name) {"
+        " pullRequests(first: $first, after: $after, states: OPEN,"
+        " orderBy: {field: CREATED_AT, direction: DESC}) {"
+        f" nodes {{ {fields} }} pageInfo {{ hasNextPage endCursor }} }} }} }}"
+    )
+    # Each page's PRs come back one per line, followed by its pageInfo
+    page_jq = f".data.repository.pullRequests | (.nodes[] | {jq}), (.pageInfo | @json)"
+
+    # Page by hand rather than with --paginate so we stop at the limit
+    lines: List[str] = []
+    cursor = None
+    while len(lines) < limit:
+        variables = {"owner": owner, "name": name, "first": min(100, limit - len(lines)), "after": cursor}
+        result = await run_gh(
+            ["api", "graphql", "--input", "-", "--jq", page_jq],
+            input=json.dumps({"query": query, "variables": variables})
+        )
+        *page, page_info = result.split("\n")
+        lines.extend(page)
+        page_info = json.loads(page_info)
+        if not page_info["hasNextPage"]:
+            break
+        cursor = page_info["endCursor"]
+    return lines
 
 
-def get_upstream_prs(config: RepoConfig) -> List[Dict]:
+async def get_upstream_prs(config: RepoConfig) -> List[Dict]:
     """Get all open PRs from upstream repo."""
     print("Fetching open PRs from upstream...")
-    result = run_gh([
-        "pr", "list",
-        "--repo", config.upstream,
-        "--state", "open",
-        "--limit", "500",
-        "--json", "number,title,baseRefName,headRefName,headRefOid,body,author,labels,isDraft"
-    ])
-    return json.loads(result) if result else []
+    lines = await list_open_prs(
+        config.upstream, 500,
+        "number title baseRefName headRefName headRefOid labels(first: 100) { nodes { name } } isDraft updatedAt",
+        ".labels = .labels.nodes | @json"
+    )
+    return [json.loads(line) for line in lines]
 
 
-def get_fork_prs(config: RepoConfig) -> Dict[str, Dict]:
+async def get_fork_prs(config: RepoConfig) -> Dict[str, ForkPR]:
     """Get all open PRs from fork, indexed by head branch."""
     print("Fetching open PRs from fork...")
-    result = run_gh([
-        "pr", "list",
-        "--repo", config.mirror,
-        "--state", "open",
-        "--limit", "1000",
-        "--json", "number,title,headRefName,headRefOid,body,labels,isDraft,id"
-    ])
-    prs = json.loads(result) if result else []
-    return {pr["headRefName"]: pr for pr in prs}
-
-
-def get_branch_name(pr: Dict, all_prs: List[Dict]) -> str:
+    # Have gh flatten each PR to one JSON array per line, so we parse small
+    # records instead of materializing the whole listing as dicts
+    lines = await list_open_prs(
+        config.mirror, 1000,
+        "number title headRefName headRefOid labels(first: 100) { nodes { name } } isDraft id",
+        "[.number, .title, .headRefName, .headRefOid, [.labels.nodes[].name], .isDraft, .id] | @json"
+    )
+    prs = (ForkPR(*json.loads(line)) for line in lines)
+    return {pr.head_ref: pr for pr in prs}
+
+
+async def run_batched_mutation(mutation: str, input_type: str, selection: str, inputs: List[Dict]) -> List[Optional[Dict]]:
+    """
+    Run one aliased mutation per input in a single GraphQL request.
+    Returns each mutation's result, or None where it failed.
+    """
+    declarations = ", ".join(f"$m{i}: {input_type}!" for i in range(len(inputs)))
+    fields = " ".join(f"m{i}: {mutation}(input: $m{i}) {{ {selection} }}" for i in range(len(inputs)))
+    # Each aliased mutation is its own write as far as GitHub's secondary
+    # limits are concerned
+    data = await run_graphql(
+        f"mutation({declarations}) {{ {fields} }}",
+        {f"m{i}": mutation_input for i, mutation_input in enumerate(inputs)},
+        mutations=len(inputs)
+    )
+    # Mutations fail independently, so a failed alias is just null
+    return [data.get(f"m{i}") for i in range(len(inputs))]
+
+
+async def get_pr_fields(repo: str, pr_nums: List[int], fields: str) -> Dict[int, Dict]:
+    """Look up GraphQL fields of many PRs in bulk, indexed by PR number."""
+    owner, name = repo.split("/", 1)
+    prs: Dict[int, Dict] = {}
+
+    # One aliased pullRequest lookup per PR, chunked to stay well under
+    # GraphQL node limits
+    for i in range(0, len(pr_nums), 50):
+        lookups = " ".join(
+            f"pr{num}: pullRequest(number: {num}) {{ {fields} }}"
+            for num in pr_nums[i:i + 50]
+        )
+        query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {lookups} }} }}"
+        # Unknown PR numbers come back as null alongside the others
+        data = await run_graphql(query, {"owner": owner, "name": name})
+        for alias, node in (data.get("repository") or {}).items():
+            if node:
+                prs[int(alias[2:])] = node
+
+    return prs
+
+
+async def load_pr_bodies(config: RepoConfig, prs: List[Tuple[Dict, str]], fork_prs: Dict[str, ForkPR]) -> None:
+    """
+    Fill in body and author on upstream PRs, and body on their existing
+    fork PRs, which the listings leave out to stay small.
+    """
+    upstream_nums = [pr["number"] for pr, _ in prs]
+    fork_nums = [fork_prs[branch_name].number for _, branch_name in prs if branch_name in fork_prs]
+    upstream_details, fork_details = await asyncio.gather(
+        get_pr_fields(config.upstream, upstream_nums, "body author { login }"),
+        get_pr_fields(config.mirror, fork_nums, "body")
+    )
+
+    for pr, branch_name in prs:
+        details = upstream_details.get(pr["number"])
+        if details is not None:
+            # Deleted accounts come back as a null author
+            pr["body"] = details["body"]
+            pr["author"] = details["author"] or {"login": "ghost"}
+
+        existing = fork_prs.get(branch_name)
+        if existing is not None and existing.number in fork_details:
+            existing.body = fork_details[existing.number]["body"]
+
+
+def sync_state_digest(config: RepoConfig, upstream_prs: List[Dict], fork_prs: Dict[str, ForkPR]) -> str:
+    """Fingerprint everything a sync decides from: the config and both PR listings."""
+    state = [
+        config.upstream,
+        config.mirror,
+        sorted(config.excluded_prs),
+        sorted(upstream_prs, key=lambda pr: pr["number"]),
+        sorted(astuple(pr) for pr in fork_prs.values()),
+    ]
+    return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
+
+def load_sync_state() -> Dict:
+    """
+    Get the state saved by the last sync: the fingerprint of the last sync
+    that had nothing to do (digest), and the upstream updatedAt each mirror
+    branch was last synced at (synced).
+    """
+    try:
+        with open(SYNC_STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(digest: Optional[str], synced: Dict[str, str]) -> None:
+    """Record the no-op fingerprint, if any, and when each branch was synced."""
+    try:
+        write_file_atomic(SYNC_STATE_FILE, json.dumps({"digest": digest, "synced": synced}))
+    except OSError as e:
+        print(f"Could not save sync state: {e}")
+
+
+def get_branch_name(pr: Dict, head_ref_counts: Counter) -> str:
     """Get the branch name for a PR, handling duplicates."""
     head_ref = pr["headRefName"]
-    # Count how many PRs have this same head ref name
-    count = sum(1 for p in all_prs if p["headRefName"] == head_ref)
-    if count > 1:
+    # Suffix with the PR number if several PRs share this head ref name
+    if head_ref_counts[head_ref] > 1:
         return f"{head_ref}-{pr['number']}"
     return head_ref
 
 
-def branch_exists_on_origin(branch: str) -> bool:
-    """Check if a branch exists on origin."""
-    result = run_cmd(
-        ["git", "ls-remote", "--heads", "origin", branch],
-        check=False
-    )
-    return bool(result and result.strip())
-
+async def get_origin_branches() -> Set[str]:
+    """Get the names of all branches on origin."""
+    # Fail rather than return nothing, which would have every base branch
+    # pushed again as missing
+    result = await run_git(["ls-remote", "--heads", "origin"])
+    branches: Set[str] = set()
+    for line in result.splitlines():
+        _, _, ref = line.partition("\t")
+        if ref.startswith("refs/heads/"):
+            branches.add(ref[len("refs/heads/"):])
+    return branches
 
-def ensure_base_branch_exists(base_ref: str) -> bool:
-    """Ensure the base branch exists on origin, fetch from upstream if needed."""
-    if branch_exists_on_origin(base_ref):
-        return True
 
-    # Try to fetch from upstream
-    print(f"  Fetching missing base branch: {base_ref}")
-    try:
-        run_cmd(["git", "fetch", "upstream", f"{base_ref}:{base_ref}"])
-        run_cmd(["git", "push", "origin", base_ref])
-        return True
-    except:
-        print(f"  WARNING: Could not fetch base branch {base_ref}")
-        return False
+async def sync_branches(transfers: List[Tuple[str, str]]) -> Set[str]:
+    """
+    Point branches on origin at upstream refs, given as (upstream_ref,
+    branch_name) pairs such as ("pull/123/head", "fix-foo").
+    PR branches are force-pushed; upstream branches such as missing bases
+    ("refs/heads/main", "main") are only pushed if that doesn't rewrite them.
+    Returns the names of the branches that were synced.
+    """
+    # Fetch into private refs rather than FETCH_HEAD, which only keeps one
+    # fetch's results, or local branches, which may be checked out. Only the
+    # PR commits are wanted, so skip tag following, FETCH_HEAD and gc.
+    def mirror_ref(upstream_ref: str) -> str:
+        return "refs/mirror/" + upstream_ref.removeprefix("refs/")
+
+    def push_refspec(upstream_ref: str, branch_name: str) -> str:
+        force = "" if upstream_ref.startswith("refs/heads/") else "+"
+        return f"{force}{mirror_ref(upstream_ref)}:refs/heads/{branch_name}"
+
+    def push(fetched: List[Tuple[str, str]]) -> Awaitable[List[Tuple[str, str]]]:
+        return run_git_batched(["push", "origin"], fetched, push_refspec)
+
+    # Pipeline the batches: push each one while the next is being fetched
+    pushed = []
+    pushing = None
+    for i in range(0, len(transfers), GIT_BATCH_SIZE):
+        fetched = await run_git_batched(
+            ["fetch", "--no-tags", "--no-write-fetch-head", "--no-auto-maintenance", "upstream"],
+            transfers[i:i + GIT_BATCH_SIZE],
+            lambda upstream_ref, branch_name: f"+{upstream_ref}:{mirror_ref(upstream_ref)}"
+        )
+        if pushing is not None:
+            pushed += await pushing
+        pushing = asyncio.create_task(push(fetched))
+    if pushing is not None:
+        pushed += await pushing
+    return {branch_name for _, branch_name in pushed}
 
 
 def get_label_names(pr: Dict) -> List[str]:
@@ -126,7 +516,7 @@ def get_label_names(pr: Dict) -> List[str]:
 def escape_mentions(text: str) -> str:
     """Escape @mentions to prevent notifications."""
     # Replace @username with `@username` (code formatting prevents ping)
-    return re.sub(r'@(\w+)', r'`@\1`', text)
+    return _MENTION_RE.sub(r'`@\1`', text)
 
 
 def build_pr_body(config: RepoConfig, pr_num: int, author: str, body: str) -> str:
@@ -142,31 +532,44 @@ def build_pr_body(config: RepoConfig, pr_num: int, author: str, body: str) -> st
 {escaped_body}"""
 
 
-def mark_pr_ready(config: RepoConfig, fork_pr_num: int) -> bool:
+def pr_metadata_differs(pr: Dict, existing: ForkPR, expected_body: Optional[str] = None) -> bool:
+    """
+    Check if a fork PR's title, labels, or draft status differ from upstream,
+    and its body too when the expected body is given.
+    """
+    return (
+        existing.title != pr["title"] or
+        (expected_body is not None and existing.body != expected_body) or
+        set(existing.labels) != set(get_label_names(pr)) or
+        existing.is_draft != pr.get("isDraft", False)
+    )
+
+
+async def mark_pr_ready(config: RepoConfig, fork_pr_num: int) -> bool:
     """Mark a draft PR as ready for review."""
     try:
-        run_gh([
+        await run_gh([
             "pr", "ready", str(fork_pr_num),
             "--repo", config.mirror
-        ])
+        ], mutations=1)
         return True
     except:
         return False
 
 
-def convert_pr_to_draft(pr_node_id: str) -> bool:
+async def convert_pr_to_draft(pr_node_id: str) -> bool:
     """Convert a ready PR back to draft using GraphQL."""
     try:
-        run_gh([
+        await run_gh([
             "api", "graphql",
             "-f", f"query=mutation {{ convertPullRequestToDraft(input: {{pullRequestId: \"{pr_node_id}\"}}) {{ pullRequest {{ isDraft }} }} }}"
-        ])
+        ], mutations=1)
         return True
     except:
         return False
 
 
-def sync_labels(config: RepoConfig, fork_pr_num: int, upstream_labels: List[str], fork_labels: List[str]) -> None:
+async def sync_labels(config: RepoConfig, fork_pr_num: int, upstream_labels: List[str], fork_labels: List[str]) -> None:
     """Sync labels between upstream and fork PRs."""
     upstream_set = set(upstream_labels)
     fork_set = set(fork_labels)
@@ -174,45 +577,45 @@ def sync_labels(config: RepoConfig, fork_pr_num: int, upstream_labels: List[str]
     # Labels to add
     to_add = upstream_set - fork_set
     if to_add:
-        run_gh([
+        await run_gh([
             "pr", "edit", str(fork_pr_num),
             "--repo", config.mirror,
             "--add-label", ",".join(to_add)
-        ], check=False)  # Don't fail if labels don't exist on fork
+        ], check=False, mutations=1)  # Don't fail if labels don't exist on fork
 
     # Labels to remove
     to_remove = fork_set - upstream_set
     if to_remove:
-        run_gh([
+        await run_gh([
             "pr", "edit", str(fork_pr_num),
             "--repo", config.mirror,
             "--remove-label", ",".join(to_remove)
-        ], check=False)
+        ], check=False, mutations=1)
 
 
-def update_pr_metadata(config: RepoConfig, fork_pr_num: int, title: str, body: str, upstream_labels: List[str], fork_labels: List[str], is_draft: bool, fork_is_draft: bool, pr_node_id: str) -> bool:
+async def update_pr_metadata(config: RepoConfig, fork_pr_num: int, title: str, body: str, upstream_labels: List[str], fork_labels: List[str], is_draft: bool, fork_is_draft: bool, pr_node_id: str) -> bool:
     """Update PR title, body, labels, and draft status."""
     try:
-        # Update title and body
-        run_gh([
+        # Update title and body, sending the body on stdin to keep it out of argv
+        await run_gh([
             "pr", "edit", str(fork_pr_num),
             "--repo", config.mirror,
             "--title", title,
-            "--body", body
-        ])
+            "--body-file", "-"
+        ], input=body, mutations=1)
 
         # Sync labels (add new, remove old)
-        sync_labels(config, fork_pr_num, upstream_labels, fork_labels)
+        await sync_labels(config, fork_pr_num, upstream_labels, fork_labels)
 
         # Update draft status if changed
         if is_draft and not fork_is_draft:
             # Convert to draft
             print(f"    Converting PR #{fork_pr_num} to draft")
-            convert_pr_to_draft(pr_node_id)
+            await convert_pr_to_draft(pr_node_id)
         elif not is_draft and fork_is_draft:
             # Mark as ready
             print(f"    Marking PR #{fork_pr_num} as ready")
-            mark_pr_ready(config, fork_pr_num)
+            await mark_pr_ready(config, fork_pr_num)
 
         return True
     except Exception as e:
@@ -220,14 +623,14 @@ def update_pr_metadata(config: RepoConfig, fork_pr_num: int, title: str, body: s
         return False
 
 
-def create_or_update_pr(config: RepoConfig, pr: Dict, branch_name: str, fork_prs: Dict[str, Dict]) -> str:
+async def update_pr(config: RepoConfig, pr: Dict, existing: ForkPR, branch_name: str, synced_branches: Set[str]) -> str:
     """
-    Create a new PR or update existing one.
-    Returns: 'created', 'updated', 'unchanged', or 'failed'
+    Update an existing fork PR. Branches that needed pushing have already
+    been synced in bulk; synced_branches holds the ones that succeeded.
+    Returns: 'updated', 'unchanged', or 'failed'
     """
     pr_num = pr["number"]
     title = pr["title"]
-    base = pr["baseRefName"]
     body = pr.get("body") or ""
     author = pr["author"]["login"]
     upstream_sha = pr["headRefOid"]
@@ -237,95 +640,157 @@ def create_or_update_pr(config: RepoConfig, pr: Dict, branch_name: str, fork_prs
     # Build the expected mirror PR body
     expected_body = build_pr_body(config, pr_num, author, body)
 
-    # Check if PR already exists on fork
-    existing = fork_prs.get(branch_name)
-
-    if existing:
-        fork_pr_num = existing["number"]
-        fork_sha = existing.get("headRefOid", "")
-        fork_title = existing.get("title", "")
-        fork_body = existing.get("body", "")
-        fork_labels = get_label_names(existing)
-        fork_is_draft = existing.get("isDraft", False)
-        fork_node_id = existing.get("id", "")
-
-        # Check if branch update needed
-        branch_updated = False
-        if fork_sha != upstream_sha:
-            print(f"  [{pr_num}] Updating branch: {branch_name}")
-            try:
-                # Fetch to FETCH_HEAD first to avoid conflict with checked-out branches
-                run_cmd(["git", "fetch", "upstream", f"pull/{pr_num}/head"])
-                run_cmd(["git", "branch", "-f", branch_name, "FETCH_HEAD"])
-                run_cmd(["git", "push", "origin", branch_name, "--force"])
-                branch_updated = True
-            except Exception as e:
-                print(f"  [{pr_num}] Failed to update branch: {e}")
-                return "failed"
-
-        # Check if metadata update needed (title, body, labels, or draft status differ)
-        metadata_changed = (
-            fork_title != title or
-            fork_body != expected_body or
-            set(fork_labels) != set(upstream_labels) or
-            fork_is_draft != is_draft
+    fork_pr_num = existing.number
+    fork_sha = existing.head_sha
+    fork_labels = existing.labels
+    fork_is_draft = existing.is_draft
+    fork_node_id = existing.node_id
+
+    # Check if branch update needed
+    branch_updated = False
+    if fork_sha != upstream_sha:
+        if branch_name not in synced_branches:
+            print(f"  [{pr_num}] Failed to update branch: {branch_name}")
+            return "failed"
+        print(f"  [{pr_num}] Updated branch: {branch_name}")
+        branch_updated = True
+
+    # Check if metadata update needed (title, body, labels, or draft status differ)
+    metadata_changed = pr_metadata_differs(pr, existing, expected_body)
+
+    if metadata_changed:
+        print(f"  [{pr_num}] Updating metadata: {branch_name}")
+        if not await update_pr_metadata(config, fork_pr_num, title, expected_body, upstream_labels, fork_labels, is_draft, fork_is_draft, fork_node_id):
+            return "failed"
+
+    if branch_updated or metadata_changed:
+        return "updated"
+    return "unchanged"
+
+
+async def get_mirror_ids(config: RepoConfig, label_names: List[str]) -> Tuple[Optional[str], Dict[str, str]]:
+    """Get the mirror repo's node ID and the node IDs of the given labels on it."""
+    owner, name = config.mirror.split("/", 1)
+    declarations = "".join(f", $l{i}: String!" for i in range(len(label_names)))
+    lookups = " ".join(f"l{i}: label(name: $l{i}) {{ id }}" for i in range(len(label_names)))
+    query = f"query($owner: String!, $name: String!{declarations}) {{ repository(owner: $owner, name: $name) {{ id {lookups} }} }}"
+
+    variables = {"owner": owner, "name": name}
+    variables.update({f"l{i}": label for i, label in enumerate(label_names)})
+    repo = (await run_graphql(query, variables)).get("repository") or {}
+
+    # Labels missing on the mirror come back as null and are skipped
+    label_ids = {
+        label: repo[f"l{i}"]["id"]
+        for i, label in enumerate(label_names) if repo.get(f"l{i}")
+    }
+    return repo.get("id"), label_ids
+
+
+async def bulk_create_prs(config: RepoConfig, specs: List[Dict]) -> Dict[str, str]:
+    """
+    Create fork PRs with aliased createPullRequest mutations, many per
+    GraphQL request, then apply their labels the same way.
+    Each spec has head, base, title, body, labels, and draft.
+    Returns the URLs of the created PRs, indexed by head branch.
+    """
+    label_names = sorted({label for spec in specs for label in spec["labels"]})
+    repo_id, label_ids = await get_mirror_ids(config, label_names)
+    if repo_id is None:
+        print(f"  Could not look up {config.mirror}")
+        return {}
+
+    urls: Dict[str, str] = {}
+    for i in range(0, len(specs), CREATE_BATCH_SIZE):
+        chunk = specs[i:i + CREATE_BATCH_SIZE]
+        results = await run_batched_mutation(
+            "createPullRequest", "CreatePullRequestInput", "pullRequest { id url }",
+            [
+                {
+                    "repositoryId": repo_id,
+                    "headRefName": spec["head"],
+                    "baseRefName": spec["base"],
+                    "title": spec["title"],
+                    "body": spec["body"],
+                    "draft": spec["draft"],
+                }
+                for spec in chunk
+            ]
         )
 
-        if metadata_changed:
-            print(f"  [{pr_num}] Updating metadata: {branch_name}")
-            update_pr_metadata(config, fork_pr_num, title, expected_body, upstream_labels, fork_labels, is_draft, fork_is_draft, fork_node_id)
+        label_inputs = []
+        for spec, result in zip(chunk, results):
+            created_pr = (result or {}).get("pullRequest")
+            if not created_pr:
+                continue
+            urls[spec["head"]] = created_pr["url"]
+            spec_label_ids = [label_ids[label] for label in spec["labels"] if label in label_ids]
+            if spec_label_ids:
+                label_inputs.append({"labelableId": created_pr["id"], "labelIds": spec_label_ids})
 
-        if branch_updated or metadata_changed:
-            return "updated"
-        return "unchanged"
+        if label_inputs:
+            await run_batched_mutation(
+                "addLabelsToLabelable", "AddLabelsToLabelableInput", "clientMutationId", label_inputs
+            )
 
-    # New PR - ensure base branch exists
-    if not ensure_base_branch_exists(base):
-        print(f"  [{pr_num}] Skipping - base branch {base} not available")
-        return "failed"
+    return urls
 
-    # Create new branch
-    draft_label = " [DRAFT]" if is_draft else ""
-    print(f"  [{pr_num}] Creating{draft_label}: {title[:50]}...")
-    try:
-        # Fetch to FETCH_HEAD first to avoid conflict with checked-out branches
-        run_cmd(["git", "fetch", "upstream", f"pull/{pr_num}/head"])
-        run_cmd(["git", "branch", "-f", branch_name, "FETCH_HEAD"])
-        run_cmd(["git", "push", "origin", branch_name, "--force"])
-    except Exception as e:
-        print(f"  [{pr_num}] Failed to create branch: {e}")
-        return "failed"
 
-    # Create PR with labels and draft status
-    try:
-        create_args = [
-            "pr", "create",
-            "--repo", config.mirror,
-            "--head", branch_name,
-            "--base", base,
-            "--title", title,
-            "--body", expected_body
-        ]
+async def create_prs(config: RepoConfig, to_create: List[Tuple[Dict, str]], synced_branches: Set[str], origin_branches: Set[str]) -> Tuple[int, int]:
+    """
+    Create fork PRs for new upstream PRs whose branches were synced and
+    whose base branches are on origin.
+    Returns: (created, failed)
+    """
+    failed = 0
+    specs = []
+    pr_nums = {}
+    for pr, branch_name in to_create:
+        pr_num = pr["number"]
+        title = pr["title"]
+        is_draft = pr.get("isDraft", False)
 
-        # Add labels if present
-        if upstream_labels:
-            create_args.extend(["--label", ",".join(upstream_labels)])
+        # New PR - base branch must exist and branch must have been created
+        if pr["baseRefName"] not in origin_branches:
+            print(f"  [{pr_num}] Skipping - base branch {pr['baseRefName']} not available")
+            failed += 1
+            continue
+        if branch_name not in synced_branches:
+            print(f"  [{pr_num}] Failed to create branch: {branch_name}")
+            failed += 1
+            continue
 
-        # Create as draft if upstream is draft
-        if is_draft:
-            create_args.append("--draft")
+        draft_label = " [DRAFT]" if is_draft else ""
+        print(f"  [{pr_num}] Creating{draft_label}: {title[:50]}...")
+        specs.append({
+            "head": branch_name,
+            "base": pr["baseRefName"],
+            "title": title,
+            "body": build_pr_body(config, pr_num, pr["author"]["login"], pr.get("body") or ""),
+            "labels": get_label_names(pr),
+            "draft": is_draft,
+        })
+        pr_nums[branch_name] = pr_num
 
-        result = run_gh(create_args)
-        print(f"  [{pr_num}] Created: {result}")
-        return "created"
-    except Exception as e:
-        print(f"  [{pr_num}] Failed to create PR: {e}")
-        return "failed"
+    urls = await bulk_create_prs(config, specs) if specs else {}
+
+    created = 0
+    for spec in specs:
+        pr_num = pr_nums[spec["head"]]
+        if spec["head"] in urls:
+            print(f"  [{pr_num}] Created: {urls[spec['head']]}")
+            created += 1
+        else:
+            print(f"  [{pr_num}] Failed to create PR")
+            failed += 1
+
+    return created, failed
 
 
-def close_stale_prs(config: RepoConfig, upstream_branches: Set[str], fork_prs: Dict[str, Dict]) -> int:
+async def close_stale_prs(config: RepoConfig, upstream_branches: Set[str], fork_prs: Dict[str, ForkPR]) -> Tuple[int, int]:
     """
     Close PRs on fork that no longer exist on upstream.
+    Returns: (closed, failed)
 
     Note: We just close PRs instead of merging them because:
     - The code is already in the mirror via branch sync (force push)
@@ -333,39 +798,56 @@ def close_stale_prs(config: RepoConfig, upstream_branches: Set[str], fork_prs: D
     - PRs are for visibility only, not for code integration
     """
     print("\n=== Closing stale PRs ===")
-    closed = 0
-
-    for branch_name, pr in fork_prs.items():
-        if branch_name not in upstream_branches:
-            pr_num = pr["number"]
-            print(f"  Closing PR #{pr_num}: {branch_name}")
-            try:
-                run_gh([
-                    "pr", "close", str(pr_num),
-                    "--repo", config.mirror,
-                    "--delete-branch",
-                    "--comment", "Upstream PR was closed or merged. Code is synced via branch mirror."
-                ], check=False)
-                closed += 1
-            except:
-                print(f"  Failed to close PR #{pr_num}")
-
-            time.sleep(0.3)  # Rate limiting
 
-    return closed
-
-
-def sync_prs(config: RepoConfig):
+    to_close = [
+        (branch_name, pr) for branch_name, pr in fork_prs.items()
+        if branch_name not in upstream_branches
+    ]
+
+    # Closes are independent, but each one writes a comment, a close and a
+    # branch deletion, so run_gh runs them one at a time, spaced apart
+    async def close_one(branch_name: str, pr: ForkPR) -> bool:
+        print(f"  Closing PR #{pr.number}: {branch_name}")
+        try:
+            await run_gh([
+                "pr", "close", str(pr.number),
+                "--repo", config.mirror,
+                "--delete-branch",
+                "--comment", "Upstream PR was closed or merged. Code is synced via branch mirror."
+            ], mutations=3)
+            return True
+        except:
+            print(f"  Failed to close PR #{pr.number}")
+            return False
+
+    results = await asyncio.gather(*(close_one(branch_name, pr) for branch_name, pr in to_close))
+    closed = sum(results)
+    return closed, len(results) - closed
+
+
+async def sync_prs(config: RepoConfig):
     """Sync all PRs from upstream to fork."""
     print("\n=== Syncing PRs ===")
 
-    # Get current state
-    upstream_prs = get_upstream_prs(config)
-    fork_prs = get_fork_prs(config)
+    # Get current state. Origin's branches are listed once up front so base
+    # branch checks don't hit the network.
+    upstream_prs, fork_prs, origin_branches = await asyncio.gather(
+        get_upstream_prs(config),
+        get_fork_prs(config),
+        get_origin_branches()
+    )
 
     print(f"Found {len(upstream_prs)} open PRs on upstream")
     print(f"Found {len(fork_prs)} open PRs on fork")
 
+    # If neither listing changed since a sync that had nothing to do, this one
+    # has nothing to do either
+    state = load_sync_state()
+    state_digest = sync_state_digest(config, upstream_prs, fork_prs)
+    if state_digest == state.get("digest"):
+        print("PRs unchanged since last sync, nothing to do")
+        return True
+
     # Build set of expected branch names
     upstream_branches: Set[str] = set()
 
@@ -378,7 +860,20 @@ def sync_prs(config: RepoConfig):
     # Sort PRs by number (oldest first) to maintain consistent ordering
     upstream_prs_sorted = sorted(upstream_prs, key=lambda x: x["number"])
 
-    # Process each upstream PR
+    # Count head ref names once so duplicate detection is a lookup per PR
+    head_ref_counts = Counter(pr["headRefName"] for pr in upstream_prs)
+
+    # Sort PRs into new, needing an update, or unchanged using only the listings,
+    # so unchanged PRs never reach the per-PR path. Bodies aren't listed, so PRs
+    # whose upstream changed since we last synced them are rechecked once their
+    # bodies are loaded. The mirror PR's own updatedAt can't tell us that, as
+    # comments and reviews on the mirror move it too.
+    synced_at: Dict[str, str] = state.get("synced") or {}
+    next_synced_at: Dict[str, str] = {}
+    to_create = []
+    to_update = []
+    to_recheck = []
+    missing_bases: Set[str] = set()
     for pr in upstream_prs_sorted:
         pr_num = pr["number"]
 
@@ -387,25 +882,98 @@ def sync_prs(config: RepoConfig):
             print(f"  [{pr_num}] Skipping (excluded)")
             continue
 
-        branch_name = get_branch_name(pr, upstream_prs)
+        branch_name = get_branch_name(pr, head_ref_counts)
         upstream_branches.add(branch_name)
 
-        result = create_or_update_pr(config, pr, branch_name, fork_prs)
+        existing = fork_prs.get(branch_name)
+        if existing is None:
+            # New PR - its base branch is mirrored along with the PR branches
+            base = pr["baseRefName"]
+            if base not in origin_branches and base not in missing_bases:
+                print(f"  Fetching missing base branch: {base}")
+                missing_bases.add(base)
+            to_create.append((pr, branch_name))
+        elif existing.head_sha != pr["headRefOid"] or pr_metadata_differs(pr, existing):
+            to_update.append((pr, branch_name))
+        elif pr["updatedAt"] > synced_at.get(branch_name, ""):
+            to_recheck.append((pr, branch_name))
+        else:
+            next_synced_at[branch_name] = synced_at[branch_name]
+            unchanged += 1
 
-        if result == "created":
-            created += 1
-        elif result == "updated":
+    await load_pr_bodies(config, to_create + to_update + to_recheck, fork_prs)
+
+    def has_body(pr: Dict, branch_name: str) -> bool:
+        if "body" in pr and (branch_name not in fork_prs or fork_prs[branch_name].body is not None):
+            return True
+        print(f"  [{pr['number']}] Failed to fetch PR body")
+        return False
+
+    pending = len(to_create) + len(to_update)
+    to_create = [(pr, branch_name) for pr, branch_name in to_create if has_body(pr, branch_name)]
+    to_update = [(pr, branch_name) for pr, branch_name in to_update if has_body(pr, branch_name)]
+    failed += pending - len(to_create) - len(to_update)
+
+    for pr, branch_name in to_recheck:
+        if not has_body(pr, branch_name):
+            failed += 1
+        elif pr_metadata_differs(pr, fork_prs[branch_name], build_pr_body(config, pr["number"], pr["author"]["login"], pr["body"] or "")):
+            to_update.append((pr, branch_name))
+        else:
+            next_synced_at[branch_name] = pr["updatedAt"]
+            unchanged += 1
+
+    transfers = [(f"refs/heads/{base}", base) for base in sorted(missing_bases)]
+    transfers += [(f"pull/{pr['number']}/head", branch_name) for pr, branch_name in to_create]
+    transfers += [
+        (f"pull/{pr['number']}/head", branch_name) for pr, branch_name in to_update
+        if fork_prs[branch_name].head_sha != pr["headRefOid"]
+    ]
+
+    # Fetch and push missing base branches and all new or moved PR heads in a
+    # few batched transfers
+    print(f"Syncing {len(transfers)} branches...")
+    synced_branches = await sync_branches(transfers)
+    origin_branches |= synced_branches
+
+    # Update existing PRs concurrently, each one is independent and I/O-bound,
+    # while new PRs are created in bulk
+    pr_slots = asyncio.Semaphore(PR_CONCURRENCY)
+
+    async def update_one(pr: Dict, branch_name: str) -> str:
+        async with pr_slots:
+            return await update_pr(config, pr, fork_prs[branch_name], branch_name, synced_branches)
+
+    (created, create_failed), results = await asyncio.gather(
+        create_prs(config, to_create, synced_branches, origin_branches),
+        asyncio.gather(
+            *(update_one(pr, branch_name) for pr, branch_name in to_update),
+            return_exceptions=True
+        )
+    )
+    failed += create_failed
+    for (pr, branch_name), result in zip(to_update, results):
+        if isinstance(result, Exception):
+            print(f"  PR sync failed: {result}")
+            result = "failed"
+
+        if result == "updated":
             updated += 1
         elif result == "unchanged":
             unchanged += 1
         else:
             failed += 1
-
-        # Small delay to avoid rate limiting
-        time.sleep(0.3)
+            continue
+        next_synced_at[branch_name] = pr["updatedAt"]
 
     # Close stale PRs (code is already synced via branches)
-    closed = close_stale_prs(config, upstream_branches, fork_prs)
+    closed, close_failed = await close_stale_prs(config, upstream_branches, fork_prs)
+    failed += close_failed
+
+    # Only a sync that changed nothing leaves the listings as they are now.
+    # New PRs aren't recorded as synced, so they're rechecked once next run.
+    noop = not (created or updated or closed or failed)
+    save_sync_state(state_digest if noop else None, next_synced_at)
 
     print(f"\n=== PR Sync Summary ===")
     print(f"Created: {created}")
@@ -460,7 +1028,7 @@ def main():
     print(f"Mirror PR Sync: {config.upstream} -> {config.mirror}")
     print("=" * 60)
 
-    success = sync_prs(config)
+    success = asyncio.run(sync_prs(config))
 
     print("\n" + "=" * 60)
     print("Sync complete!" if success else "Sync completed with errors")